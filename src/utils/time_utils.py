@@ -1,10 +1,117 @@
+import functools
+import logging
+import re
+from typing import TYPE_CHECKING
 import whenever
-import pandas as pd # Keep for initial flexible string parsing
+# pandas/numpy are imported lazily inside the functions that need them (string parsing fallback,
+# convert_series_to_et), so market-hours helpers don't pay the ~200 ms pandas import.
+if TYPE_CHECKING:
+    import pandas as pd
 from datetime import datetime as std_datetime, date as std_date, timezone as std_timezone # For type hints and conversion from pandas
+from zoneinfo import ZoneInfo
+
+# Conversion failures are logged at DEBUG (callers such as process_data_timestamps summarize them);
+# lazy %-formatting means no message is built unless the level is enabled.
+logger = logging.getLogger(__name__)
 
 # Define the target timezone string
 TARGET_TZ = "America/New_York"
 
+# Trailing " Area/Location" IANA name on a timestamp string, e.g. "2023-10-25 10:00:00 Europe/London"
+_TZ_SUFFIX_RE = re.compile(r' ([A-Za-z][^ /]*/[^ ]+)$')
+
+# Trailing UTC designator or numeric offset on an ISO8601 string (used by convert_series_to_et)
+_OFFSET_SUFFIX_PATTERN = r'(?:Z|[+-]\d{2}:?\d{2})$'
+# _TZ_SUFFIX_RE as a pandas str.extract pattern: (datetime part, zone name)
+_TZ_SUFFIX_SPLIT_PATTERN = r'^(.*) ([A-Za-z][^ /]*/[^ ]+)$'
+
+# Unix seconds convert_series_to_et maps to timestamps; anything outside (or NaN/inf) becomes NaT.
+# datetime's year 1-9999 range, less a day at the start so the ET wall time (behind UTC) stays in year 1.
+_SERIES_MIN_UNIX_SECONDS = std_datetime(1, 1, 2, tzinfo=std_timezone.utc).timestamp()
+_SERIES_MAX_UNIX_SECONDS = std_datetime.max.replace(tzinfo=std_timezone.utc).timestamp()
+
+
+@functools.lru_cache(maxsize=512)
+def _is_valid_tz(tz_name: str) -> bool:
+    """
+    Returns True if tz_name is an IANA timezone name known to `whenever`.
+
+    Cached so that a feed repeating the same trailing token (e.g. "Europe/London")
+    pays for the lookup, and for any TimeZoneNotFoundError, only once per name.
+    """
+    try:
+        # Validate by using it with a dummy date; this resolves the name through whenever's tz database.
+        whenever.Date(2000, 1, 1).at(whenever.Time(0, 0)).assume_tz(tz_name, disambiguate='raise')
+        return True
+    except (whenever.TimeZoneNotFoundError, ValueError, TypeError):
+        return False
+
+# Per-type converters used by convert_to_et via _CONVERTERS. They may raise whenever/ValueError
+# exceptions; convert_to_et turns those into an error message and None.
+def _from_instant(ts: whenever.Instant, original_tz_str: str | None) -> whenever.ZonedDateTime:
+    return ts.to_tz(TARGET_TZ)
+
+
+def _from_zoned(ts: whenever.ZonedDateTime, original_tz_str: str | None) -> whenever.ZonedDateTime:
+    if ts.tz == TARGET_TZ:
+        return ts
+    return ts.to_tz(TARGET_TZ)
+
+
+def _from_plain(ts: whenever.PlainDateTime, original_tz_str: str | None) -> whenever.ZonedDateTime | None:
+    if not original_tz_str:
+        logger.debug("Error: whenever.PlainDateTime provided without original_tz_str. Ambiguous conversion for %s.", ts)
+        return None
+    # This will raise SkippedTime or RepeatedTime if ambiguous and disambiguate='raise' (default for assume_tz)
+    # For our purpose, we want to know if the original_tz makes it invalid, so 'raise' is good.
+    return ts.assume_tz(original_tz_str, disambiguate='raise').to_tz(TARGET_TZ)
+
+
+def _from_py_datetime(py_dt: std_datetime, original_tz_str: str | None) -> whenever.ZonedDateTime | None:
+    if py_dt.tzinfo is None: # Naive Python datetime
+        if not original_tz_str:
+            logger.debug("Error: Naive Python datetime provided without original_tz_str. Ambiguous conversion for %s.", py_dt)
+            return None
+        if type(py_dt) is std_datetime:
+            # Exact type only: subclasses such as pandas.Timestamp carry extra state (nanoseconds)
+            return _naive_py_datetime_to_et(py_dt, original_tz_str)
+        plain_dt = whenever.PlainDateTime.from_py_datetime(py_dt)
+        # This will use disambiguate='raise' by default if not specified,
+        # or we can be explicit. 'raise' helps identify invalid naive times.
+        return plain_dt.assume_tz(original_tz_str, disambiguate='raise').to_tz(TARGET_TZ)
+    # Aware Python datetime
+    # zoneinfo.ZoneInfo (what pandas and whenever use) resolves DST via `fold` and maps
+    # straight onto a ZonedDateTime, so no localize/normalize step is needed.
+    if type(py_dt.tzinfo) is ZoneInfo and py_dt.tzinfo.key:
+        return whenever.ZonedDateTime.from_py_datetime(py_dt).to_tz(TARGET_TZ)
+    # Fixed offsets (incl. stdlib UTC) map directly onto an instant.
+    if isinstance(py_dt.tzinfo, std_timezone):
+        return whenever.Instant.from_py_datetime(py_dt).to_tz(TARGET_TZ)
+    # Any other tzinfo (pytz, dateutil, ...): go through its UTC equivalent instant.
+    # Checking the type up front avoids raising and catching a ValueError per call.
+    utc_py_dt = py_dt.astimezone(std_timezone.utc)
+    return whenever.Instant.from_py_datetime(utc_py_dt).to_tz(TARGET_TZ)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _naive_py_datetime_to_et(py_dt: std_datetime, original_tz_str: str) -> whenever.ZonedDateTime:
+    # Tick feeds repeat the same wall-clock second many times. The conversion is pure, so repeats are
+    # served from the cache. SkippedTime/RepeatedTime propagate uncached and are re-raised on each call.
+    plain_dt = whenever.PlainDateTime.from_py_datetime(py_dt)
+    return plain_dt.assume_tz(original_tz_str, disambiguate='raise').to_tz(TARGET_TZ)
+
+
+def _from_unix(ts: int | float, original_tz_str: str | None) -> whenever.ZonedDateTime:
+    # Unix seconds are absolute, so original_tz_str is not part of the cache key
+    return _unix_seconds_to_et(int(ts))
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _unix_seconds_to_et(seconds: int) -> whenever.ZonedDateTime:
+    # Bar feeds repeat the same minute boundaries; the ZonedDateTime result is immutable, so sharing it is safe
+    return whenever.Instant.from_timestamp(seconds).to_tz(TARGET_TZ)
+
+
 def convert_to_et(timestamp_input: any, original_tz_str: str | None = None) -> whenever.ZonedDateTime | None:
     """
     Converts a given timestamp input to a whenever.ZonedDateTime in 'America/New_York' (ET).
@@ -29,136 +136,238 @@ def convert_to_et(timestamp_input: any, original_tz_str: str | None = None) -> w
                                 with original_tz_str results in a non-existent or ambiguous time
                                 and 'raise' is the effective disambiguation strategy.
     """
+    # Dominant case once data has been converted: already an ET ZonedDateTime, returned as-is
+    if type(timestamp_input) is whenever.ZonedDateTime and timestamp_input.tz == TARGET_TZ:
+        return timestamp_input
+
     try:
-        # 1. Handle whenever native types
-        if isinstance(timestamp_input, whenever.Instant):
-            return timestamp_input.to_tz(TARGET_TZ)
-        if isinstance(timestamp_input, whenever.ZonedDateTime):
-            if timestamp_input.tz == TARGET_TZ:
-                return timestamp_input
-            return timestamp_input.to_tz(TARGET_TZ)
-        if isinstance(timestamp_input, whenever.PlainDateTime):
-            if not original_tz_str:
-                print(f"Error: whenever.PlainDateTime provided without original_tz_str. Ambiguous conversion for {timestamp_input}.")
-                return None
-            # This will raise SkippedTime or RepeatedTime if ambiguous and disambiguate='raise' (default for assume_tz)
-            # For our purpose, we want to know if the original_tz makes it invalid, so 'raise' is good.
-            return timestamp_input.assume_tz(original_tz_str, disambiguate='raise').to_tz(TARGET_TZ)
-
-        # 2. Handle Python datetime.datetime
-        if isinstance(timestamp_input, std_datetime):
-            py_dt = timestamp_input
-            if py_dt.tzinfo is None: # Naive Python datetime
-                if not original_tz_str:
-                    print(f"Error: Naive Python datetime provided without original_tz_str. Ambiguous conversion for {py_dt}.")
-                    return None
-                plain_dt = whenever.PlainDateTime.from_py_datetime(py_dt)
-                # This will use disambiguate='raise' by default if not specified,
-                # or we can be explicit. 'raise' helps identify invalid naive times.
-                return plain_dt.assume_tz(original_tz_str, disambiguate='raise').to_tz(TARGET_TZ)
-            else: # Aware Python datetime
-                # Convert aware Python datetime to whenever.Instant first, then to ZonedDateTime
-                # Note: whenever.Instant.from_py_datetime expects UTC or raises error if tz is not ZoneInfo UTC.
-                # A more general path for aware py_dt is to convert to its UTC equivalent instant.
-                # If it has ZoneInfo, ZonedDateTime.from_py_datetime(py_dt).to_tz(TARGET_TZ) is better.
-                if isinstance(py_dt.tzinfo, type(std_timezone.utc)): # Check if it's stdlib UTC
-                     instant = whenever.Instant.from_py_datetime(py_dt)
-                     return instant.to_tz(TARGET_TZ)
-                try:
-                    # Attempt to convert directly if tzinfo is ZoneInfo (used by whenever)
-                    # This requires py_dt.tzinfo to be a zoneinfo.ZoneInfo object.
-                    # If pandas parsed a string with tz, it might be zoneinfo.
-                    zdt = whenever.ZonedDateTime.from_py_datetime(py_dt)
-                    return zdt.to_tz(TARGET_TZ)
-                except ValueError: # Likely if tzinfo is not what whenever expects (e.g. pytz)
-                    # Fallback: convert to UTC instant then to target TZ
-                    utc_py_dt = py_dt.astimezone(std_timezone.utc)
-                    instant = whenever.Instant.from_py_datetime(utc_py_dt)
-                    return instant.to_tz(TARGET_TZ)
-
-
-        # 3. Handle Unix timestamp (int/float)
-        if isinstance(timestamp_input, (int, float)):
-            return whenever.Instant.from_timestamp(int(timestamp_input)).to_tz(TARGET_TZ)
-
-        # 4. Handle string inputs
-        if isinstance(timestamp_input, str):
-            s = timestamp_input
-            # Attempt 1: Direct ISO parsing by whenever (for UTC or fixed offset strings)
-            try:
-                # Heuristic: Check if it looks like an ISO string with offset/Z
-                # A more robust check might involve trying both parsers if one fails.
-                if 'Z' in s or '+' in s or (s.count('-') >= 3 and s[10:].count('-') > 0 and s[10:].startswith("-")): # crude check for offset like -04:00
-                    # Try OffsetDateTime first as it's more specific for offsets than Instant's ISO
-                    try:
-                        odt = whenever.OffsetDateTime.parse_common_iso(s)
-                        return odt.to_tz(TARGET_TZ)
-                    except ValueError: # If not OffsetDateTime ISO, try Instant ISO (for Z)
-                        instant = whenever.Instant.parse_common_iso(s)
-                        return instant.to_tz(TARGET_TZ)
-            except ValueError:
-                pass # Fall through if not a direct ISO parse by whenever
-
-            # Attempt 2: Check for "datetime_string Timezone/Name" pattern
-            parts = s.split(" ")
-            potential_tz_name_from_string = None
-            datetime_part_str = s # Default to full string if no TZ part found
-
-            if len(parts) > 1:
-                # Heuristic: last part contains '/' and first component of TZ is not all digits
-                # e.g. "Europe/London" not "10/11" from "10/11/2023"
-                last_part = parts[-1]
-                if "/" in last_part and not last_part.split('/')[0].isdigit():
-                    try:
-                        # Validate if it's a known timezone by trying to use it with a dummy date
-                        # This is a bit heavy but ensures it's a valid IANA name known to `whenever`
-                        whenever.Date(2000,1,1).at(whenever.Time(0,0)).assume_tz(last_part, disambiguate='raise')
-                        potential_tz_name_from_string = last_part
-                        datetime_part_str = " ".join(parts[:-1])
-                    except (whenever.TimeZoneNotFoundError, ValueError, TypeError):
-                        potential_tz_name_from_string = None # Not a valid TZ name
-
-            # Attempt 3: Use pandas for flexible parsing of the (potentially shortened) datetime_part_str
-            try:
-                # Ensure pandas doesn't try to infer timezone from ambiguous strings like "Europe/London"
-                # by parsing only the datetime_part_str.
-                py_dt_from_pd = pd.to_datetime(datetime_part_str).to_pydatetime()
-
-                # Determine the original_tz for this py_dt_from_pd
-                # Priority: 1. From string split, 2. From function arg, 3. Default for naive strings
-                final_original_tz_for_conversion = original_tz_str # From function args
-                if potential_tz_name_from_string:
-                    final_original_tz_for_conversion = potential_tz_name_from_string
-                elif py_dt_from_pd.tzinfo is None and not final_original_tz_for_conversion:
-                    # If still naive and no TZ info from string or args, assume TARGET_TZ
-                    final_original_tz_for_conversion = TARGET_TZ
-
-                # Now convert py_dt_from_pd using final_original_tz_for_conversion
-                # This recursive call handles the py_datetime object correctly.
-                return convert_to_et(py_dt_from_pd, original_tz_str=final_original_tz_for_conversion)
-
-            except ValueError as e_pd:
-                print(f"Error: Pandas could not parse string timestamp '{datetime_part_str}' (derived from '{s}'): {e_pd}")
-                return None
-            except Exception as e_general_str_parse: # Catch other errors during this string parsing block
-                print(f"Error processing string timestamp '{s}': {e_general_str_parse}")
-                return None
-
-        print(f"Error: Unsupported timestamp input type: {type(timestamp_input)}")
+        # One dict lookup on the exact type instead of walking an isinstance chain.
+        # See _CONVERTERS (defined below _convert_str_to_et) for the supported types.
+        converter = _CONVERTERS.get(type(timestamp_input))
+        if converter is None:
+            # Subclasses (e.g. pandas.Timestamp, bool) are rare: match them in the original priority order
+            for base_type, base_converter in _CONVERTERS.items():
+                if isinstance(timestamp_input, base_type):
+                    converter = base_converter
+                    break
+        if converter is not None:
+            return converter(timestamp_input, original_tz_str)
+
+        logger.debug("Error: Unsupported timestamp input type: %s", type(timestamp_input))
         return None
 
     except (whenever.SkippedTime, whenever.RepeatedTime) as e_dst:
-        print(f"Error: DST transition issue for input {timestamp_input} (orig_tz: {original_tz_str}). Time is non-existent or ambiguous: {e_dst}")
+        logger.debug("Error: DST transition issue for input %s (orig_tz: %s). Time is non-existent or ambiguous: %s", timestamp_input, original_tz_str, e_dst)
         return None
     except whenever.TimeZoneNotFoundError as e_tz_not_found:
-        print(f"Error: Timezone not found: {e_tz_not_found}")
+        logger.debug("Error: Timezone not found: %s", e_tz_not_found)
         return None
     except ValueError as e_val: # Catch other ValueErrors from whenever constructors/methods
-        print(f"Error: Value error during conversion for {timestamp_input}: {e_val}")
+        logger.debug("Error: Value error during conversion for %s: %s", timestamp_input, e_val)
         return None
     except Exception as e_general: # Catch-all for unexpected issues
-        print(f"An unexpected error occurred converting {timestamp_input}: {e_general}")
+        logger.debug("An unexpected error occurred converting %s: %s", timestamp_input, e_general)
+        return None
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _convert_str_to_et(s: str, original_tz_str: str | None) -> whenever.ZonedDateTime | None:
+    """
+    String branch of convert_to_et, memoized on (s, original_tz_str).
+
+    Market data repeats identical timestamp strings (several ticks per second, repeated bars),
+    so each distinct string is parsed only once. The cached results are immutable
+    whenever.ZonedDateTime objects (or None), so sharing them between callers is safe.
+    Errors are reported once per distinct input.
+    """
+    # Blank cells are common in CSV exports. Reject them, and anything too short to hold a year,
+    # before any parser runs (pandas would otherwise turn "" into 0001-01-01). Surrounding
+    # whitespace is ignored.
+    s = s.strip()
+    if len(s) < 4:
+        logger.debug("Error: Empty or too short timestamp string %r", s)
+        return None
+
+    # Attempt 1: ISO8601 fast path. Cheap character checks pick exactly one of whenever's native
+    # ISO parsers; anything it rejects falls through to the general parsers below. (A regex
+    # classifier costs more than the parse itself; the old "'Z' in s or '+' in s" test also fired
+    # on suffixes like "Europe/Zurich" and paid for two failed parses.)
+    if s[10:11] in ('T', ' ') and '/' not in s: # ISO date-time without an "Area/Location" suffix
+        try:
+            # Exactly one parse per string: the last characters decide which parser applies
+            if s[-1] == 'Z':
+                return whenever.Instant.parse_common_iso(s).to_tz(TARGET_TZ)
+            if s[-6] in '+-' or s[-5] in '+-': # +HH:MM or +HHMM suffix
+                return whenever.OffsetDateTime.parse_common_iso(s).to_tz(TARGET_TZ)
+            plain = whenever.PlainDateTime.parse_common_iso(s)
+            if plain.nanosecond % 1000: # Truncate to microseconds, as when parsed through a Python datetime
+                plain = plain.replace(nanosecond=plain.nanosecond // 1000 * 1000)
+            # Naive: same tz priority as Attempt 3 (argument, else TARGET_TZ); DST errors handled by convert_to_et
+            return convert_to_et(plain, original_tz_str=original_tz_str or TARGET_TZ)
+        except ValueError:
+            pass # Fall through to the general parsers below
+
+    # Attempt 2: Check for "datetime_string Timezone/Name" pattern
+    # One precompiled regex search instead of split()/join() on every string; the captured token
+    # contains '/' and starts with a letter (e.g. "Europe/London", not "10/11" from "10/11/2023").
+    potential_tz_name_from_string = None
+    datetime_part_str = s # Default to full string if no TZ part found
+
+    tz_suffix = _TZ_SUFFIX_RE.search(s)
+    if tz_suffix and _is_valid_tz(tz_suffix.group(1)):
+        potential_tz_name_from_string = tz_suffix.group(1)
+        datetime_part_str = s[:tz_suffix.start()]
+
+    # Attempt 3: Parse the (potentially shortened) datetime_part_str.
+    # Ensure the parser doesn't try to infer timezone from strings like "Europe/London"
+    # by parsing only the datetime_part_str.
+    try:
+        try:
+            # Fast path: the C-implemented ISO 8601 parser from the stdlib covers the common
+            # "YYYY-MM-DD HH:MM:SS[.ffffff][+HH:MM]" shapes without building a pandas Timestamp.
+            py_dt = std_datetime.fromisoformat(datetime_part_str)
+        except ValueError:
+            # Fall back to pandas for flexible parsing of other formats
+            import pandas as pd # Lazy: cached in sys.modules after the first fallback
+            py_dt = pd.to_datetime(datetime_part_str).to_pydatetime()
+
+        # Determine the original_tz for this py_dt
+        # Priority: 1. From string split, 2. From function arg, 3. Default for naive strings
+        final_original_tz_for_conversion = original_tz_str # From function args
+        if potential_tz_name_from_string:
+            final_original_tz_for_conversion = potential_tz_name_from_string
+        elif py_dt.tzinfo is None and not final_original_tz_for_conversion:
+            # If still naive and no TZ info from string or args, assume TARGET_TZ
+            final_original_tz_for_conversion = TARGET_TZ
+
+        # Now convert py_dt using final_original_tz_for_conversion
+        # This recursive call handles the py_datetime object correctly.
+        return convert_to_et(py_dt, original_tz_str=final_original_tz_for_conversion)
+
+    except ValueError as e_parse:
+        logger.debug("Error: Could not parse string timestamp '%s' (derived from '%s'): %s", datetime_part_str, s, e_parse)
         return None
+    except Exception as e_general_str_parse: # Catch other errors during this string parsing block
+        logger.debug("Error processing string timestamp '%s': %s", s, e_general_str_parse)
+        return None
+
+
+# Exact-type dispatch table for convert_to_et. Insertion order is the isinstance fallback priority.
+_CONVERTERS = {
+    whenever.Instant: _from_instant,
+    whenever.ZonedDateTime: _from_zoned,
+    whenever.PlainDateTime: _from_plain,
+    std_datetime: _from_py_datetime,
+    int: _from_unix,
+    float: _from_unix,
+    str: _convert_str_to_et, # Memoized string parsing
+}
+
+
+def convert_series_to_et(values: any, original_tz_str: str | None = None) -> 'pd.DatetimeIndex':
+    """
+    Vectorized counterpart of convert_to_et for a whole column of timestamps of one kind.
+
+    Args:
+        values: pd.Series, pd.Index, np.ndarray or list holding one of: Unix seconds (int/float),
+                datetime64 values (naive or tz-aware), Python datetimes (naive and/or aware, any
+                tzinfo), or ISO8601 strings (naive, with Z/offset, or naive with a trailing zone
+                name such as "2023-10-25 10:00:00 Europe/London").
+        original_tz_str (str | None): Timezone assumed for naive values. As in convert_to_et, naive
+                                      strings fall back to TARGET_TZ when it is None, while naive
+                                      datetimes cannot be resolved (NaT).
+
+    Returns:
+        pd.DatetimeIndex: tz-aware in TARGET_TZ and aligned with values. NaT where a value could not
+                          be parsed, Unix seconds fall outside years 1-9999, a zone name is unknown,
+                          a naive datetime comes without original_tz_str, or a naive wall time is
+                          non-existent/ambiguous in its zone (the cases where convert_to_et returns None).
+    """
+    import numpy as np
+    import pandas as pd
+
+    series = values.reset_index(drop=True) if isinstance(values, pd.Series) else pd.Series(values)
+    tz_name = original_tz_str or TARGET_TZ
+
+    if pd.api.types.is_bool_dtype(series):
+        raise TypeError("convert_series_to_et does not accept boolean values.")
+
+    if pd.api.types.is_numeric_dtype(series):
+        # Unix seconds, truncated like convert_to_et's int(timestamp_input); NaN becomes NaT
+        seconds = np.trunc(series.to_numpy(dtype=np.float64, na_value=np.nan))
+        # Masked to NaN (-> NaT) first: pandas raises on values it cannot localize
+        in_range = (seconds >= _SERIES_MIN_UNIX_SECONDS) & (seconds < _SERIES_MAX_UNIX_SECONDS)
+        seconds[~in_range] = np.nan
+        index = pd.DatetimeIndex(pd.to_datetime(seconds, unit='s', utc=True))
+    elif isinstance(series.dtype, pd.DatetimeTZDtype):
+        index = pd.DatetimeIndex(series)
+    elif pd.api.types.is_datetime64_dtype(series):
+        if original_tz_str is None: # Naive datetimes need an explicit zone (convert_to_et returns None)
+            index = pd.DatetimeIndex(pd.Series(pd.NaT, index=series.index, dtype='datetime64[us, UTC]'))
+        else:
+            index = pd.DatetimeIndex(series).tz_localize(original_tz_str, ambiguous='NaT', nonexistent='NaT')
+    else:
+        # Object column. Aware values (strings with an explicit Z/offset, datetimes with a tzinfo) are
+        # absolute; the rest are wall times in their row's zone (row_tz), None where it is unknown.
+        non_null = series[series.notna()]
+        if len(non_null) and all(isinstance(v, std_datetime) for v in non_null):
+            # Python datetimes pandas could not infer a single dtype for: mixed zones, tzinfo types, naive/aware
+            is_absolute = series.map(lambda v: getattr(v, 'tzinfo', None) is not None).to_numpy(dtype=bool)
+            row_tz = pd.Series(original_tz_str, index=series.index, dtype=object)
+            parse_options = {}
+        else:
+            # "<datetime> Area/Location" strings: the zone name replaces tz_name for that row. Like
+            # convert_to_et, an unknown name leaves the whole string unparseable (NaT).
+            zone_parts = series.str.extract(_TZ_SUFFIX_SPLIT_PATTERN)
+            has_zone = zone_parts[1].notna().to_numpy(dtype=bool)
+            row_tz = pd.Series(tz_name, index=series.index, dtype=object)
+            if has_zone.any():
+                valid_zone = has_zone & zone_parts[1].map(_is_valid_tz, na_action='ignore').to_numpy(dtype=bool, na_value=False)
+                row_tz[valid_zone] = zone_parts[1][valid_zone]
+                series = series.where(~has_zone, zone_parts[0].where(valid_zone))
+            is_absolute = series.str.contains(_OFFSET_SUFFIX_PATTERN, regex=True, na=False).to_numpy(dtype=bool)
+            parse_options = {'format': 'ISO8601'}
+        utc_values = pd.Series(pd.NaT, index=series.index, dtype='datetime64[us, UTC]')
+        if is_absolute.any():
+            utc_values[is_absolute] = pd.to_datetime(series[is_absolute], utc=True, errors='coerce', **parse_options)
+        # One parse + localize per distinct zone (normally just tz_name)
+        for zone in row_tz[~is_absolute].dropna().unique():
+            rows = ~is_absolute & (row_tz == zone).to_numpy(dtype=bool)
+            naive = pd.DatetimeIndex(pd.to_datetime(series[rows], errors='coerce', **parse_options))
+            utc_values[rows] = naive.tz_localize(zone, ambiguous='NaT', nonexistent='NaT').tz_convert('UTC')
+        index = pd.DatetimeIndex(utc_values)
+
+    return index.tz_convert(TARGET_TZ)
+
+
+def to_whenever_list(index: 'pd.DatetimeIndex') -> list:
+    """
+    Boxes a tz-aware DatetimeIndex (e.g. from convert_series_to_et) into whenever objects.
+
+    Bulk work should stay in the DatetimeIndex; call this once, where callers need ZonedDateTimes.
+
+    Args:
+        index (pd.DatetimeIndex): tz-aware timestamps (any timezone).
+
+    Returns:
+        list: whenever.ZonedDateTime objects in TARGET_TZ, with None for NaT.
+    """
+    if index.tz is None:
+        raise ValueError("to_whenever_list requires a tz-aware DatetimeIndex.")
+    import pandas as pd
+
+    # This per-row boxing dominates any bulk conversion, so the loop body is kept to one call:
+    # one ZonedDateTime constructor (no intermediate Instant), bound once outside the loop.
+    from_nanos = whenever.ZonedDateTime.from_timestamp_nanos
+    try:
+        nanos = index.as_unit('ns').asi8.tolist()
+    except pd.errors.OutOfBoundsDatetime:
+        # Outside ~1677-2262: go through microseconds, which cover the full datetime range
+        nanos = [us * 1_000 for us in index.as_unit('us').asi8.tolist()]
+    if not index.hasnans:
+        return [from_nanos(ns, tz=TARGET_TZ) for ns in nanos]
+    is_nat = index.isna().tolist()
+    return [None if nat else from_nanos(ns, tz=TARGET_TZ) for ns, nat in zip(nanos, is_nat)]
 
 
 def get_market_open_close_et(
@@ -180,57 +389,79 @@ def get_market_open_close_et(
             (market_open_et, market_close_et).
             Returns (None, None) if time strings are invalid or other errors occur.
     """
+    if isinstance(date_input, std_date) and not isinstance(date_input, std_datetime):
+        w_date = whenever.Date.from_py_date(date_input)
+    elif isinstance(date_input, whenever.Date):
+        w_date = date_input
+    else:
+        logger.warning("Error: Invalid date_input type: %s. Expected whenever.Date or datetime.date.", type(date_input))
+        return None, None
+
     try:
-        if isinstance(date_input, std_date) and not isinstance(date_input, std_datetime):
-            w_date = whenever.Date.from_py_date(date_input)
-        elif isinstance(date_input, whenever.Date):
-            w_date = date_input
-        else:
-            print(f"Error: Invalid date_input type: {type(date_input)}. Expected whenever.Date or datetime.date.")
-            return None, None
+        return _market_open_close_et(w_date, open_time_str, close_time_str)
+    except TypeError as e_unhashable: # Time "strings" that cannot be cache keys are invalid anyway
+        logger.warning("Error parsing time strings or date: '%s', '%s'. %s", open_time_str, close_time_str, e_unhashable)
+        return None, None
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_hh_mm(time_str: str) -> whenever.Time:
+    """
+    Parses and range-checks an "HH:MM" string. Memoized: a run only ever uses a handful of session times.
+
+    Raises:
+        ValueError, TypeError, AttributeError: On malformed input (lru_cache does not cache exceptions).
+    """
+    hour, minute = map(int, time_str.split(':'))
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError("Hour or minute out of valid range.")
+    return whenever.Time(hour, minute)
+
 
-        open_hour, open_minute = map(int, open_time_str.split(':'))
-        close_hour, close_minute = map(int, close_time_str.split(':'))
+@functools.lru_cache(maxsize=8192)
+def _market_open_close_et(
+    w_date: whenever.Date,
+    open_time_str: str,
+    close_time_str: str
+) -> tuple[whenever.ZonedDateTime | None, whenever.ZonedDateTime | None]:
+    """
+    Cached core of get_market_open_close_et, keyed on (date, open "HH:MM", close "HH:MM").
 
-        if not (0 <= open_hour <= 23 and 0 <= open_minute <= 59 and \
-                0 <= close_hour <= 23 and 0 <= close_minute <= 59):
-            raise ValueError("Hour or minute out of valid range.")
+    Backtests and parameter sweeps ask for the same days and windows repeatedly; the DST-aware
+    construction runs once per key. The results are immutable, so sharing them is safe.
+    """
+    try:
+        open_time = _parse_hh_mm(open_time_str)
+        close_time = _parse_hh_mm(close_time_str)
 
-        # Construct ZonedDateTime directly.
+        # Combine the date with the cached Time and localize in one step
+        # (several times faster than the field-by-field ZonedDateTime constructor).
         # For typical market hours (9:30, 16:00), 'compatible' or 'raise' are usually fine.
         # 'raise' is safer to ensure the exact time is valid.
         # 'compatible' mimics Python's datetime.astimezone behavior during DST transitions.
         # Let's use 'raise' to be strict.
-        market_open_et = whenever.ZonedDateTime(
-            w_date.year, w_date.month, w_date.day,
-            open_hour, open_minute,
-            tz=TARGET_TZ,
-            disambiguate='raise'
-        )
-        market_close_et = whenever.ZonedDateTime(
-            w_date.year, w_date.month, w_date.day,
-            close_hour, close_minute,
-            tz=TARGET_TZ,
-            disambiguate='raise'
-        )
+        market_open_et = w_date.at(open_time).assume_tz(TARGET_TZ, disambiguate='raise')
+        market_close_et = w_date.at(close_time).assume_tz(TARGET_TZ, disambiguate='raise')
         return market_open_et, market_close_et
 
     except (ValueError, TypeError) as e_parse: # Catches map/split errors, int conversion, out of range
-        print(f"Error parsing time strings or date: '{open_time_str}', '{close_time_str}'. {e_parse}")
+        logger.warning("Error parsing time strings or date: '%s', '%s'. %s", open_time_str, close_time_str, e_parse)
         return None, None
     except (whenever.SkippedTime, whenever.RepeatedTime) as e_dst:
         # This would be rare for 9:30/16:00 but good to catch.
-        print(f"Error: DST transition issue for market time on {w_date.format_common_iso()}: {e_dst}")
+        logger.warning("Error: DST transition issue for market time on %s: %s", w_date, e_dst)
         return None, None
     except whenever.TimeZoneNotFoundError as e_tz_not_found:
-        print(f"Error: Timezone '{TARGET_TZ}' not found: {e_tz_not_found}")
+        logger.warning("Error: Timezone '%s' not found: %s", TARGET_TZ, e_tz_not_found)
         return None, None
     except Exception as e_general:
-        print(f"An unexpected error in get_market_open_close_et: {e_general}")
+        logger.warning("An unexpected error in get_market_open_close_et: %s", e_general)
         return None, None
 
 
 if __name__ == '__main__':
+    # Show conversion errors in the examples below
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("--- whenever time_utils examples ---")
 
     # Example 1: Naive Python datetime, assume UTC
@@ -1,13 +1,19 @@
 import unittest
+from unittest import mock
+import numpy as np
 import whenever # Main datetime library
 from src.data_handler.market_data_loader import (
     process_data_timestamps,
     calculate_initial_balance,
     is_within_initial_balance,
+    is_within_ib_ns,
+    is_within_ib_ns_arr,
     load_raw_data
 )
-from src.utils.time_utils import TARGET_TZ # For checks and creating test data
-from datetime import datetime as std_datetime # For some raw input types
+from src.data_handler import market_data_loader
+from src.utils.time_utils import TARGET_TZ, convert_to_et # For checks and creating test data
+from datetime import datetime as std_datetime, timezone as std_timezone # For some raw input types
+from decimal import Decimal
 
 class TestMarketDataLoader(unittest.TestCase):
 
@@ -63,6 +69,118 @@ class TestMarketDataLoader(unittest.TestCase):
         self.assertEqual(processed[1]['timestamp_et'].minute, 30)
         self.assertEqual(processed[1]['timestamp_et'].offset.in_hours(), -4) # EDT
 
+    def test_process_data_timestamps_logs_one_failure_summary(self):
+        raw_data = [
+            {"timestamp": "2024-03-10 02:30:00"}, # Non-existent in ET
+            {"timestamp": "not a timestamp"},
+            {"timestamp": "2023-10-25 09:30:00"},
+        ]
+        with self.assertLogs('src.data_handler.market_data_loader', level='WARNING') as captured:
+            processed = process_data_timestamps(raw_data)
+        self.assertEqual(len(captured.records), 1)
+        self.assertIn("2 record(s) failed timestamp conversion", captured.output[0])
+        self.assertIsNotNone(processed[2]['timestamp_et'])
+
+    def test_process_data_timestamps_does_not_mutate_input(self):
+        raw_data = [{"timestamp": "2023-10-25 09:30:00", "high": 1.0}]
+        processed = process_data_timestamps(raw_data)
+        self.assertNotIn('timestamp_et', raw_data[0])
+        self.assertIsNot(processed[0], raw_data[0])
+        self.assertEqual(processed[0]['high'], 1.0)
+
+    def test_process_data_timestamps_inplace(self):
+        raw_data = [{"timestamp": "2023-08-15T13:30:00Z", "high": 1.0}, {"timestamp": "bad"}]
+        processed = process_data_timestamps(raw_data, inplace=True)
+        self.assertIs(processed, raw_data)
+        self.assertEqual(raw_data[0]['timestamp_et'], whenever.ZonedDateTime(2023, 8, 15, 9, 30, tz=TARGET_TZ))
+        self.assertIsNone(raw_data[1]['timestamp_et'])
+
+    def test_process_data_timestamps_small_input_skips_bulk_path(self):
+        # A handful of records goes straight through convert_to_et; pandas' setup cost would dominate
+        with mock.patch.object(market_data_loader, '_bulk_convert_to_et') as bulk:
+            processed = process_data_timestamps([{"timestamp": "2023-08-15T13:30:00Z"}])
+        bulk.assert_not_called()
+        self.assertEqual(processed[0]['timestamp_et'], whenever.ZonedDateTime(2023, 8, 15, 9, 30, tz=TARGET_TZ))
+
+    @mock.patch.object(market_data_loader, '_BULK_MIN_ROWS', 0) # Force the vectorized path
+    def test_process_data_timestamps_matches_convert_to_et(self):
+        # The vectorized column path must agree with per-value convert_to_et, including DST gaps/overlaps
+        raw_values = [
+            "2024-03-10 01:59:00", "2024-03-10 02:30:00", "2024-03-10 03:00:00", # Spring forward
+            "2023-11-05 00:59:00", "2023-11-05 01:30:00", "2023-11-05 02:00:00", # Fall back
+            std_datetime(2023, 11, 5, 1, 30), std_datetime(2023, 8, 15, 9, 30),
+            std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc),
+            "2023-08-15T15:30:00+02:00", "2023-08-15T13:30:00.250000Z",
+            1678624200, 1678624200.9,
+            "2023-10-25 10:00:00 Europe/London", "2023-03-26 01:30:00 Europe/London", # Grouped per zone name
+            "2023-11-05 01:30:00 America/New_York", "2023-10-25 10:00:00 Foo/Bar", # Ambiguous; unknown zone
+            "not a timestamp",
+        ]
+        for tz in ('America/New_York', 'Europe/London', None):
+            processed = process_data_timestamps([{"timestamp": v} for v in raw_values], default_original_tz=tz)
+            for raw, record in zip(raw_values, processed):
+                with self.subTest(tz=tz, raw=raw):
+                    expected = convert_to_et(raw, original_tz_str=tz)
+                    self.assertEqual(record['timestamp_et'], expected)
+                    if expected is not None:
+                        self.assertEqual(record['timestamp_et'].offset, expected.offset)
+
+    @mock.patch.object(market_data_loader, '_BULK_MIN_ROWS', 0) # Force the vectorized path
+    def test_process_data_timestamps_single_format_columns(self):
+        # Homogeneous columns take the whole-column path; results must match convert_to_et
+        columns = [
+            ["2023-08-15 09:30:00", "2024-03-10 02:30:00", "2023-11-05 01:30:00"],
+            ["2023-08-15T13:30:00Z", "2023-08-15T15:30:00+02:00"],
+            [1678624200, 1692106200],
+            [std_datetime(2023, 8, 15, 9, 30), std_datetime(2023, 11, 5, 1, 30)],
+        ]
+        for column in columns:
+            processed = process_data_timestamps([{"timestamp": v} for v in column])
+            for raw, record in zip(column, processed):
+                with self.subTest(raw=raw):
+                    self.assertEqual(record['timestamp_et'], convert_to_et(raw, original_tz_str='America/New_York'))
+
+    def test_uniform_kind_only_fast_paths_kinds_pandas_wins(self):
+        uniform_kind = market_data_loader._uniform_kind
+        self.assertEqual(uniform_kind(["2023-08-15 09:30:00", "2023-08-15T09:31"]), 'naive_str')
+        self.assertEqual(uniform_kind([1678624200, 1678624260]), 'unix')
+        self.assertEqual(uniform_kind([std_datetime(2023, 8, 15, 9, 30)]), 'naive_dt')
+        # whenever parses these faster than pandas + boxing: no whole-column fast path
+        self.assertIsNone(uniform_kind(["2023-08-15T13:30:00Z", "2023-08-15T15:30:00+02:00"]))
+        self.assertIsNone(uniform_kind([std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc)]))
+        self.assertIsNone(uniform_kind(["2023-08-15 09:30:00", 1678624200]))
+        self.assertIsNone(uniform_kind(["2023-08-15 09:30:00", "2023-08-15T13:30:00Z"]))
+
+    @mock.patch.object(market_data_loader, '_BULK_MIN_ROWS', 0)
+    def test_process_data_timestamps_aware_feed_skips_bulk_path(self):
+        # whenever parses Z/offset strings and converts aware datetimes faster than pandas + boxing
+        for first in ("2023-08-15T13:30:00Z", "2023-08-15T15:30:00+02:00",
+                      std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc)):
+            with self.subTest(first=first), mock.patch.object(market_data_loader, '_bulk_convert_to_et') as bulk:
+                processed = process_data_timestamps([{"timestamp": first}, {"timestamp": "2023-08-15 09:30:00"}])
+            bulk.assert_not_called()
+            expected = whenever.ZonedDateTime(2023, 8, 15, 9, 30, tz=TARGET_TZ)
+            self.assertEqual([r['timestamp_et'] for r in processed], [expected, expected])
+
+    def test_bulk_convert_leaves_aware_inputs_to_convert_to_et(self):
+        column = ["2023-08-15 09:30:00", "2023-08-15T13:30:00Z", "2023-08-15T15:30:00+02:00",
+                  std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc), 1692106200]
+        results = market_data_loader._bulk_convert_to_et(column, 'America/New_York')
+        expected = whenever.ZonedDateTime(2023, 8, 15, 9, 30, tz=TARGET_TZ)
+        self.assertEqual([results[0], results[4]], [expected, expected])
+        self.assertTrue(all(r is market_data_loader._UNRESOLVED for r in results[1:4]))
+
+    @mock.patch.object(market_data_loader, '_BULK_MIN_ROWS', 0) # Force the vectorized path
+    def test_process_data_timestamps_unhashable_tzinfo(self):
+        # dateutil's tzutc/tzoffset are unhashable; column classification must not put them in a set
+        from dateutil import parser as dateutil_parser
+        column = [dateutil_parser.isoparse("2023-08-15T13:30:00Z"), dateutil_parser.isoparse("2023-08-15T14:30:00+01:00")]
+        processed = process_data_timestamps([{"timestamp": v} for v in column])
+        for raw, record in zip(column, processed):
+            with self.subTest(raw=raw):
+                self.assertEqual(record['timestamp_et'], whenever.ZonedDateTime(2023, 8, 15, 9, 30, tz=TARGET_TZ))
+                self.assertEqual(record['timestamp_et'], convert_to_et(raw))
+
     def test_calculate_initial_balance_standard_day_edt(self):
         # Timestamps are whenever.ZonedDateTime in ET
         data = [
@@ -111,6 +229,17 @@ class TestMarketDataLoader(unittest.TestCase):
         self.assertIsNone(ib_info[trade_date]['ib_low'])
         self.assertIn("message", ib_info[trade_date])
 
+    def test_calculate_initial_balance_missing_prices_skipped(self):
+        data = [
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': None, 'low': 100},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 45, 0, tz=TARGET_TZ), 'high': 102},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 10, 0, 0, tz=TARGET_TZ), 'high': 101, 'low': 100.5},
+        ]
+        trade_date = whenever.Date(2023, 8, 15)
+        ib_info = calculate_initial_balance(data)
+        self.assertEqual(ib_info[trade_date]['ib_high'], 102)
+        self.assertEqual(ib_info[trade_date]['ib_low'], 100)
+
     def test_calculate_initial_balance_weekend_skip(self):
         saturday_date = whenever.Date(2023, 10, 28) # A Saturday
         self.assertEqual(saturday_date.day_of_week(), whenever.Weekday.SATURDAY)
@@ -139,6 +268,70 @@ class TestMarketDataLoader(unittest.TestCase):
         self.assertEqual(ib_info[trade_date]['ib_start_et'], expected_ib_start)
         self.assertEqual(ib_info[trade_date]['ib_end_et'], expected_ib_end)
 
+    def test_build_market_frame_sorts_and_drops_invalid(self):
+        data = [
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 10, 0, 0, tz=TARGET_TZ), 'high': 101, 'low': 100.5, 'volume': 10},
+            {'timestamp_et': None, 'high': 999, 'low': 0},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': 100, 'low': 99},
+        ]
+        frame = market_data_loader._build_market_frame(data)
+        self.assertEqual(len(frame), 2)
+        self.assertTrue(np.all(np.diff(frame.ts_ns) > 0))
+        self.assertEqual(frame.ts_ns[0], data[2]['timestamp_et'].timestamp_nanos())
+        self.assertEqual(frame.high.tolist(), [100.0, 101.0])
+        self.assertTrue(np.isnan(frame.volume[0]))
+        self.assertEqual(frame.volume[1], 10.0)
+
+    def test_calculate_initial_balance_ignores_unused_and_non_numeric_fields(self):
+        # Fields the IB does not read are not converted; unconvertible highs/lows count as missing
+        data = [
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': 101, 'low': 100,
+             'open': [1], 'volume': '1,000'},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 45, 0, tz=TARGET_TZ), 'high': 10**400, 'low': 'n/a',
+             'close': 10**400},
+        ]
+        ib_info = calculate_initial_balance(data)
+        trade_date = whenever.Date(2023, 8, 15)
+        self.assertEqual(ib_info[trade_date]['ib_high'], 101)
+        self.assertEqual(ib_info[trade_date]['ib_low'], 100)
+
+        frame = market_data_loader._build_market_frame(data)
+        self.assertEqual(frame.high.tolist()[0], 101.0)
+        self.assertTrue(np.isnan(frame.high[1]))
+        self.assertTrue(np.isnan(frame.open[0]) and np.isnan(frame.volume[0]) and np.isnan(frame.close[1]))
+        self.assertIsNone(market_data_loader._build_market_frame(data, columns=("high", "low")).volume)
+
+    def test_calculate_initial_balance_returns_original_price_values(self):
+        # Out of time order, so the frame's sorted rows must still map back to the right records
+        data = [
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 10, 0, 0, tz=TARGET_TZ), 'high': 101, 'low': Decimal('99.25')},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': 100.5, 'low': Decimal('99.75')},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 45, 0, tz=TARGET_TZ), 'high': None, 'low': None},
+        ]
+        ib_info = calculate_initial_balance(data)[whenever.Date(2023, 8, 15)]
+        self.assertIs(type(ib_info['ib_high']), int)
+        self.assertEqual(ib_info['ib_high'], 101)
+        self.assertIs(type(ib_info['ib_low']), Decimal)
+        self.assertEqual(ib_info['ib_low'], Decimal('99.25'))
+
+        all_missing = [{'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': None}]
+        ib_info = calculate_initial_balance(all_missing)[whenever.Date(2023, 8, 15)]
+        self.assertIsNone(ib_info['ib_high'])
+        self.assertIsNone(ib_info['ib_low'])
+
+    def test_calculate_initial_balance_unsorted_input(self):
+        data = [
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 16, 9, 45, 0, tz=TARGET_TZ), 'high': 205, 'low': 204},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 10, 15, 0, tz=TARGET_TZ), 'high': 103, 'low': 101},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 10, 30, 0, tz=TARGET_TZ), 'high': 110, 'low': 90},
+            {'timestamp_et': whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ), 'high': 102, 'low': 100},
+        ]
+        ib_info = calculate_initial_balance(data)
+        self.assertEqual(list(ib_info), [whenever.Date(2023, 8, 15), whenever.Date(2023, 8, 16)])
+        self.assertEqual(ib_info[whenever.Date(2023, 8, 15)]['ib_high'], 103)
+        self.assertEqual(ib_info[whenever.Date(2023, 8, 15)]['ib_low'], 100)
+        self.assertEqual(ib_info[whenever.Date(2023, 8, 16)]['ib_high'], 205)
+
     def test_is_within_initial_balance(self):
         ib_start = whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ)
         ib_end = whenever.ZonedDateTime(2023, 8, 15, 10, 30, 0, tz=TARGET_TZ)
@@ -162,6 +355,20 @@ class TestMarketDataLoader(unittest.TestCase):
         py_dt = std_datetime(2023, 8, 15, 10, 0, 0) # Python datetime
         self.assertFalse(is_within_initial_balance(py_dt, ib_start, ib_end))
 
+    def test_is_within_ib_ns_scalar_and_array(self):
+        ib_start = whenever.ZonedDateTime(2023, 8, 15, 9, 30, 0, tz=TARGET_TZ)
+        ib_end = whenever.ZonedDateTime(2023, 8, 15, 10, 30, 0, tz=TARGET_TZ)
+        candidates = [
+            ib_start.subtract(seconds=1), ib_start, ib_start.add(minutes=15),
+            ib_end.subtract(seconds=1), ib_end,
+        ]
+        expected = [is_within_initial_balance(t, ib_start, ib_end) for t in candidates]
+        start_ns, end_ns = ib_start.timestamp_nanos(), ib_end.timestamp_nanos()
+        candidates_ns = [t.timestamp_nanos() for t in candidates]
+
+        self.assertEqual([is_within_ib_ns(t, start_ns, end_ns) for t in candidates_ns], expected)
+        self.assertEqual(is_within_ib_ns_arr(candidates_ns, start_ns, end_ns).tolist(), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,14 @@
+import os
+import sys
+import time
 import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
 import whenever # Main datetime library
-from src.utils.time_utils import convert_to_et, get_market_open_close_et, TARGET_TZ
-from datetime import datetime as std_datetime, date as std_date, timezone as std_timezone # For creating some test inputs
+from src.utils.time_utils import convert_to_et, convert_series_to_et, get_market_open_close_et, to_whenever_list, TARGET_TZ
+from datetime import datetime as std_datetime, date as std_date, timezone as std_timezone, timedelta # For creating some test inputs
+from zoneinfo import ZoneInfo
 
 class TestTimeUtils(unittest.TestCase):
 
@@ -47,12 +54,37 @@ class TestTimeUtils(unittest.TestCase):
         self.assertEqual(et_dt.minute, 30)
         self.assertEqual(et_dt.offset.in_hours(), -5) # EST
 
+    def test_convert_to_et_aware_py_datetime_zoneinfo_fold(self):
+        # 2023-10-29 01:30 happens twice in London; fold selects BST (fold=0) or GMT (fold=1)
+        first = std_datetime(2023, 10, 29, 1, 30, tzinfo=ZoneInfo("Europe/London"))
+        second = first.replace(fold=1)
+        et_first = convert_to_et(first)
+        et_second = convert_to_et(second)
+        self.assertEqual(et_first.hour, 20) # 00:30 UTC -> 20:30 EDT on the 28th
+        self.assertEqual(et_second.hour, 21) # 01:30 UTC -> 21:30 EDT on the 28th
+        self.assertEqual(et_first.day, 28)
+
+    def test_convert_to_et_aware_py_datetime_fixed_offset(self):
+        aware_py_dt = std_datetime(2023, 8, 15, 15, 30, tzinfo=std_timezone(timedelta(hours=2)))
+        et_dt = convert_to_et(aware_py_dt)
+        self.assertIsNotNone(et_dt)
+        self.assertEqual(et_dt.hour, 9) # 13:30 UTC -> 09:30 EDT
+        self.assertEqual(et_dt.offset.in_hours(), -4)
+
     def test_convert_to_et_naive_py_datetime_no_original_tz(self):
         # Naive Python datetime, no original_tz_str. Should fail.
         ambiguous_naive_py_dt = std_datetime(2023, 10, 26, 10, 30)
         et_dt = convert_to_et(ambiguous_naive_py_dt, original_tz_str=None)
         self.assertIsNone(et_dt) # Expect None as it's ambiguous
 
+    def test_convert_to_et_naive_py_datetime_repeated_input_is_memoized(self):
+        first = convert_to_et(std_datetime(2023, 8, 15, 15, 30), original_tz_str="Europe/London")
+        self.assertEqual((first.hour, first.minute), (10, 30))
+        self.assertIs(convert_to_et(std_datetime(2023, 8, 15, 15, 30), original_tz_str="Europe/London"), first)
+        # The source zone is part of the key
+        other = convert_to_et(std_datetime(2023, 8, 15, 15, 30), original_tz_str="UTC")
+        self.assertEqual(other.hour, 11)
+
     def test_convert_to_et_whenever_instant(self):
         # whenever.Instant (already UTC)
         instant = whenever.Instant.from_utc(2023, 10, 26, 14, 30) # 2:30 PM UTC
@@ -96,6 +128,31 @@ class TestTimeUtils(unittest.TestCase):
         self.assertEqual(et_dt.minute, 30)
         self.assertEqual(et_dt.offset.in_hours(), -4) # EDT
 
+    def test_convert_to_et_unix_timestamp_repeated_input_is_memoized(self):
+        first = convert_to_et(1678624200)
+        self.assertIs(convert_to_et(1678624200), first)
+        self.assertIs(convert_to_et(1678624200.5, original_tz_str="UTC"), first) # Truncated; tz is irrelevant
+
+    def test_convert_to_et_subclass_inputs(self):
+        # Subclasses are not in the exact-type dispatch table but still resolve to their base converter
+        pd_ts = pd.Timestamp("2023-08-15 13:30:00", tz="UTC") # datetime subclass
+        et_dt = convert_to_et(pd_ts)
+        self.assertEqual((et_dt.hour, et_dt.minute), (9, 30))
+
+        class TickTime(str):
+            pass
+        et_dt = convert_to_et(TickTime("2023-08-15T13:30:00Z"))
+        self.assertEqual((et_dt.hour, et_dt.minute), (9, 30))
+
+    def test_convert_to_et_unsupported_type(self):
+        self.assertIsNone(convert_to_et(object()))
+        self.assertIsNone(convert_to_et(None))
+
+    def test_convert_to_et_failure_is_logged_not_printed(self):
+        with self.assertLogs('src.utils.time_utils', level='DEBUG') as captured:
+            self.assertIsNone(convert_to_et(object()))
+        self.assertIn("Unsupported timestamp input type", captured.output[0])
+
     def test_convert_to_et_string_iso_utc(self):
         iso_str_utc = "2023-08-15T13:30:00Z"
         et_dt = convert_to_et(iso_str_utc) # No original_tz_str needed for UTC string
@@ -111,7 +168,7 @@ class TestTimeUtils(unittest.TestCase):
         self.assertEqual(et_dt.offset.in_hours(), -4)
 
     def test_convert_to_et_string_naive_assume_et(self):
-        # convert_to_et, when parsing a naive string via pandas, and original_tz_str is not passed from caller,
+        # convert_to_et, when parsing a naive string and original_tz_str is not passed from caller,
         # will internally assume TARGET_TZ for the naive datetime string.
         naive_str = "2023-10-26 10:30:00"
         et_dt = convert_to_et(naive_str) # original_tz_str=None, convert_to_et assumes TARGET_TZ
@@ -127,6 +184,50 @@ class TestTimeUtils(unittest.TestCase):
         self.assertEqual(et_dt.hour, 10) # 10:30 AM EDT
         self.assertEqual(et_dt.offset.in_hours(), -4)
 
+    def test_convert_to_et_iso_strings_do_not_use_pandas(self):
+        # ISO-shaped strings must be handled by whenever's parsers; pandas is only the last-resort fallback.
+        # A None entry in sys.modules makes any "import pandas" raise ImportError.
+        # (Strings not used elsewhere in this file, so none of them is already cached.)
+        with mock.patch.dict(sys.modules, {'pandas': None}):
+            naive = convert_to_et("2019-06-03 10:30:00", original_tz_str=TARGET_TZ)
+            naive_t = convert_to_et("2019-06-03T10:30:00.250", original_tz_str="Europe/London")
+            utc = convert_to_et("2019-06-03T14:30:00Z")
+            offset = convert_to_et("2019-06-03 16:30:00+0200")
+        self.assertEqual((naive.hour, naive.minute, naive.offset.in_hours()), (10, 30, -4))
+        self.assertEqual((naive_t.hour, naive_t.minute, naive_t.nanosecond), (5, 30, 250_000_000)) # 10:30 BST -> 05:30 EDT
+        self.assertEqual(utc, naive)
+        self.assertEqual(offset, naive)
+
+    def test_convert_to_et_blank_and_padded_strings(self):
+        for blank in ("", "   ", "\t", "123"):
+            with self.subTest(blank=blank):
+                self.assertIsNone(convert_to_et(blank))
+        padded = convert_to_et(" 2023-08-15T13:30:00Z ")
+        self.assertEqual(padded, convert_to_et("2023-08-15T13:30:00Z"))
+
+    def test_convert_to_et_string_with_tz_name_suffix(self):
+        # 10:00 London (BST) is 09:00 UTC -> 05:00 EDT
+        et_dt = convert_to_et("2023-10-25 10:00:00 Europe/London")
+        self.assertEqual((et_dt.hour, et_dt.minute), (5, 0))
+        # Multi-part IANA names; 10:00 Buenos Aires (UTC-3) is 13:00 UTC -> 09:00 EDT
+        et_dt = convert_to_et("2023-10-25 10:00:00 America/Argentina/Buenos_Aires")
+        self.assertEqual((et_dt.hour, et_dt.minute), (9, 0))
+        # A date with slashes is not mistaken for a timezone suffix
+        et_dt = convert_to_et("10/11/2023 10:00", original_tz_str=TARGET_TZ)
+        self.assertEqual((et_dt.month, et_dt.day, et_dt.hour), (10, 11, 10))
+        self.assertIsNone(convert_to_et("2023-10-25 10:00:00 Not/AZone"))
+
+    def test_convert_to_et_string_repeated_input_is_memoized(self):
+        # Identical strings are parsed once; later calls are served from the cache.
+        ts_str = "2023-08-15 11:45:00"
+        first = convert_to_et(ts_str, original_tz_str=TARGET_TZ)
+        second = convert_to_et(ts_str, original_tz_str=TARGET_TZ)
+        self.assertIsNotNone(first)
+        self.assertIs(first, second)
+        # A different original_tz_str is a different cache key
+        as_utc = convert_to_et(ts_str, original_tz_str="UTC")
+        self.assertEqual(as_utc.hour, 7) # 11:45 UTC is 07:45 EDT
+
     def test_convert_to_et_dst_spring_forward_non_existent(self):
         # 2024-03-10 02:30:00 does not exist in America/New_York
         # convert_to_et should return None due to disambiguate='raise'
@@ -142,6 +243,114 @@ class TestTimeUtils(unittest.TestCase):
         et_dt = convert_to_et(ambiguous_str, original_tz_str=TARGET_TZ)
         self.assertIsNone(et_dt) # Expecting None because RepeatedTime should be caught
 
+    @unittest.skipUnless(os.environ.get("RUN_PERF"), "perf-only: set RUN_PERF=1")
+    def test_convert_to_et_throughput(self):
+        # Regression gate for the per-value conversion paths (dispatch, parsing, zone conversion).
+        # Every timed input is distinct, so the memoized shapes are measured on cache misses, not lru hits.
+        # The bound is deliberately loose (misses cost ~0.4-1.2 us on a laptop); tighten per runner via PERF_MAX_NS_PER_OP.
+        max_ns_per_op = int(os.environ.get("PERF_MAX_NS_PER_OP", "5000"))
+        n = 100_000
+        base = std_datetime(2031, 1, 1) # A year no other test uses
+        minutes = [timedelta(minutes=i) for i in range(n)]
+        inputs = {
+            'aware_py_datetime': [base.replace(tzinfo=std_timezone.utc) + m for m in minutes],
+            'naive_py_datetime': [base + m for m in minutes],
+            'iso_string': [(base + m).isoformat(sep=' ') for m in minutes],
+            'unix_seconds': [int(base.replace(tzinfo=std_timezone.utc).timestamp()) + 60 * i for i in range(n)],
+        }
+        convert_to_et(std_datetime(2000, 1, 1), original_tz_str='UTC') # Warm-up: resolve the zones once
+        for label, values in inputs.items():
+            with self.subTest(label=label):
+                start = time.perf_counter_ns()
+                for value in values:
+                    convert_to_et(value, original_tz_str='UTC')
+                ns_per_op = (time.perf_counter_ns() - start) / n
+                self.assertLess(ns_per_op, max_ns_per_op, f"convert_to_et[{label}]: {ns_per_op:.0f} ns/op")
+
+    # --- Tests for convert_series_to_et ---
+    def test_convert_series_to_et_strings_match_convert_to_et(self):
+        values = [
+            "2023-08-15 09:30:00", "2023-08-15T13:30:00Z", "2023-08-15T15:30:00+02:00",
+            "2024-03-10 02:30:00", "2023-11-05 01:30:00", # DST gap / overlap -> NaT
+            "garbage",
+        ]
+        index = convert_series_to_et(values, original_tz_str=TARGET_TZ)
+        self.assertEqual(str(index.tz), TARGET_TZ)
+        for raw, ts in zip(values, index):
+            with self.subTest(raw=raw):
+                expected = convert_to_et(raw, original_tz_str=TARGET_TZ)
+                if expected is None:
+                    self.assertTrue(pd.isna(ts))
+                else:
+                    self.assertEqual(ts.value // 1000, expected.timestamp_nanos() // 1000)
+
+    def test_convert_series_to_et_matches_convert_to_et(self):
+        # Zone-name suffixes and naive datetimes without original_tz_str follow convert_to_et's rules
+        strings = [
+            "2023-03-13 09:30:00 America/Chicago", "2023-10-25 10:00:00 Europe/London",
+            "2023-03-26 01:30:00 Europe/London", # Non-existent in London -> NaT
+            "2023-10-25 10:00:00 Foo/Bar", # Unknown zone -> NaT
+            "2023-08-15T13:30:00Z", "2023-08-15 09:30:00",
+        ]
+        naive_datetimes = [std_datetime(2023, 8, 15, 9, 30), std_datetime(2024, 3, 10, 2, 30)]
+        cases = [
+            (strings, strings),
+            (naive_datetimes + [std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc)], None), # Object column
+            (pd.Series(pd.to_datetime(["2023-08-15 09:30", "2024-03-10 02:30"])), naive_datetimes), # datetime64
+        ]
+        for tz in (None, "Europe/London"):
+            for values, raw_values in cases:
+                index = convert_series_to_et(values, original_tz_str=tz)
+                for i, ts in enumerate(index):
+                    raw = (raw_values or values)[i]
+                    with self.subTest(tz=tz, raw=raw):
+                        expected = convert_to_et(raw, original_tz_str=tz)
+                        if expected is None:
+                            self.assertTrue(pd.isna(ts))
+                        else:
+                            self.assertEqual(ts.value // 1000, expected.timestamp_nanos() // 1000)
+
+    def test_convert_series_to_et_unix_and_datetime64(self):
+        unix_index = convert_series_to_et(np.array([1678624200, 1678624200.9, np.nan]))
+        self.assertEqual(unix_index[0], pd.Timestamp("2023-03-12 08:30", tz=TARGET_TZ))
+        self.assertEqual(unix_index[1], unix_index[0]) # Truncated like convert_to_et
+        self.assertTrue(pd.isna(unix_index[2]))
+
+        naive = pd.Series(pd.to_datetime(["2023-08-15 14:30"]))
+        london_index = convert_series_to_et(naive, original_tz_str="Europe/London")
+        self.assertEqual(london_index[0], pd.Timestamp("2023-08-15 09:30", tz=TARGET_TZ))
+
+    def test_convert_series_to_et_out_of_range_unix_is_nat(self):
+        index = convert_series_to_et([1678624200, 10**12, -10**12, 1e20, float('inf')])
+        self.assertEqual(index[0], pd.Timestamp("2023-03-12 08:30", tz=TARGET_TZ))
+        self.assertTrue(index[1:].isna().all())
+
+    def test_convert_series_to_et_object_python_datetimes(self):
+        # Mixed zones / naive-and-aware values leave pandas with an object column (no .str accessor)
+        values = [
+            std_datetime(2023, 8, 15, 13, 30, tzinfo=std_timezone.utc),
+            std_datetime(2023, 8, 15, 14, 30, tzinfo=ZoneInfo("Europe/London")),
+            std_datetime(2023, 8, 15, 9, 30), # Naive: wall time in original_tz_str
+            std_datetime(2024, 3, 10, 2, 30), # Naive and non-existent in ET
+            None,
+        ]
+        index = convert_series_to_et(values, original_tz_str=TARGET_TZ)
+        expected = pd.Timestamp("2023-08-15 09:30", tz=TARGET_TZ)
+        self.assertEqual(index[:3].tolist(), [expected] * 3)
+        self.assertTrue(index[3:].isna().all())
+
+    def test_to_whenever_list(self):
+        values = ["2023-08-15T13:30:00.250000Z", "2024-03-10 02:30:00"]
+        boxed = to_whenever_list(convert_series_to_et(values))
+        self.assertEqual(boxed[0], convert_to_et(values[0]))
+        self.assertEqual(boxed[0].tz, TARGET_TZ)
+        self.assertIsNone(boxed[1]) # NaT (non-existent in ET)
+        # Beyond the nanosecond range (year 2262+); boxed via microseconds
+        far = [1678624200, 253402300799]
+        self.assertEqual(to_whenever_list(convert_series_to_et(far)), [convert_to_et(v) for v in far])
+        with self.assertRaises(ValueError):
+            to_whenever_list(pd.DatetimeIndex(["2023-08-15 09:30"]))
+
     # --- Tests for get_market_open_close_et ---
     def test_get_market_open_close_et_summer_edt(self):
         w_date = whenever.Date(2023, 8, 15) # EDT
@@ -190,6 +399,18 @@ class TestTimeUtils(unittest.TestCase):
         self.assertEqual(open_dt.day, 1)
         self.assertEqual(open_dt.hour, 9)
 
+    def test_get_market_open_close_et_repeated_date_is_cached(self):
+        # Same trading day via whenever.Date and datetime.date shares one cached result
+        first = get_market_open_close_et(whenever.Date(2023, 7, 3))
+        second = get_market_open_close_et(std_date(2023, 7, 3))
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+
+    def test_get_market_open_close_et_unhashable_time_str(self):
+        open_dt, close_dt = get_market_open_close_et(whenever.Date(2023, 7, 3), open_time_str=["09", "30"])
+        self.assertIsNone(open_dt)
+        self.assertIsNone(close_dt)
+
     def test_get_market_open_close_dst_spring_forward_market_hours_ok(self):
         # March 10, 2024: 2 AM -> 3 AM. Market hours 9:30-16:00 are fine.
         date_dst_start = whenever.Date(2024, 3, 10)